@@ -1,30 +1,56 @@
 #!/usr/bin/env python3
 
 import json
+import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # headless: charts are only written to PNG files
 import matplotlib.pyplot as plt
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Endpoint paths as reported by the artillery metrics-by-endpoint plugin
+ENDPOINTS = ['compute', 'echo', 'users/{{ userId }}', 'health', 'stats']
+
+# Inline copy of the ggplot stylesheet keys used below (avoids plt.style.use)
+PLOT_STYLE = {
+    'axes.facecolor': '#E5E5E5',
+    'axes.edgecolor': 'white',
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'axes.labelcolor': '#555555',
+    'axes.labelsize': 'large',
+    'axes.titlesize': 'x-large',
+    'axes.prop_cycle': "cycler('color', ['#E24A33', '#348ABD', '#988ED5', '#777777', '#FBC15E', '#8EBA42', '#FFB5B8'])",
+    'grid.color': 'white',
+    'grid.linestyle': '-',
+    'patch.edgecolor': '#EEEEEE',
+    'patch.linewidth': 0.5,
+    'xtick.color': '#555555',
+    'ytick.color': '#555555'
+}
+
 def load_and_parse_data(file_path):
-    with open(file_path, 'r') as file:
-        data = json.load(file)
-    return data
+    with open(file_path, 'rb') as file:
+        raw = file.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
 
 def create_visualizations(data):
-    # Set style to a built-in style
-    plt.style.use('ggplot')
+    plt.rcParams.update(PLOT_STYLE)
+
+    counters = data['aggregate']['counters']
+    summaries = data['aggregate']['summaries']
 
     # Create figure with subplots
     fig = plt.figure(figsize=(15, 20))
 
     # 1. Response Time Distribution
     plt.subplot(3, 1, 1)
-    response_times = {
-        'min': data['aggregate']['summaries']['http.response_time']['min'],
-        'median': data['aggregate']['summaries']['http.response_time']['median'],
-        'p95': data['aggregate']['summaries']['http.response_time']['p95'],
-        'p99': data['aggregate']['summaries']['http.response_time']['p99'],
-        'max': data['aggregate']['summaries']['http.response_time']['max']
-    }
+    http_response_time = summaries['http.response_time']
+    response_times = {stat: http_response_time[stat] for stat in ['min', 'median', 'p95', 'p99', 'max']}
     plt.bar(response_times.keys(), response_times.values(), color='skyblue')
     plt.title('Response Time Distribution (ms)')
     plt.ylabel('Time (ms)')
@@ -32,23 +58,18 @@ def create_visualizations(data):
     # 2. Endpoint Distribution
     plt.subplot(3, 1, 2)
     endpoints = {
-        'compute': data['aggregate']['counters']['plugins.metrics-by-endpoint./compute.codes.200'],
-        'echo': data['aggregate']['counters']['plugins.metrics-by-endpoint./echo.codes.200'],
-        'users': data['aggregate']['counters']['plugins.metrics-by-endpoint./users/{{ userId }}.codes.200'],
-        'health': data['aggregate']['counters']['plugins.metrics-by-endpoint./health.codes.200'],
-        'stats': data['aggregate']['counters']['plugins.metrics-by-endpoint./stats.codes.200']
+        ep.split('/')[0]: counters[f'plugins.metrics-by-endpoint./{ep}.codes.200']
+        for ep in ENDPOINTS
     }
     plt.pie(endpoints.values(), labels=endpoints.keys(), autopct='%1.1f%%')
     plt.title('Request Distribution by Endpoint')
 
     # 3. Time Series of Requests
     plt.subplot(3, 1, 3)
-    timestamps = []
-    requests = []
-
-    for period in data['intermediate']:
-        timestamps.append(pd.to_datetime(int(period['period']), unit='ms'))
-        requests.append(period['counters']['http.requests'])
+    intermediate = data['intermediate']
+    periods = np.fromiter((int(p['period']) for p in intermediate), dtype='int64', count=len(intermediate))
+    timestamps = pd.to_datetime(periods, unit='ms')
+    requests = np.fromiter((p['counters']['http.requests'] for p in intermediate), dtype='int64', count=len(intermediate))
 
     plt.plot(timestamps, requests, marker='o', color='green')
     plt.title('Requests Over Time')
@@ -63,11 +84,8 @@ def create_visualizations(data):
     # Create additional detailed response time graph
     plt.figure(figsize=(10, 6))
     endpoint_response_times = {
-        'compute': data['aggregate']['summaries']['plugins.metrics-by-endpoint.response_time./compute']['mean'],
-        'echo': data['aggregate']['summaries']['plugins.metrics-by-endpoint.response_time./echo']['mean'],
-        'users': data['aggregate']['summaries']['plugins.metrics-by-endpoint.response_time./users/{{ userId }}']['mean'],
-        'health': data['aggregate']['summaries']['plugins.metrics-by-endpoint.response_time./health']['mean'],
-        'stats': data['aggregate']['summaries']['plugins.metrics-by-endpoint.response_time./stats']['mean']
+        ep.split('/')[0]: summaries[f'plugins.metrics-by-endpoint.response_time./{ep}']['mean']
+        for ep in ENDPOINTS
     }
     plt.bar(endpoint_response_times.keys(), endpoint_response_times.values(), color='lightcoral')
     plt.title('Average Response Time by Endpoint')